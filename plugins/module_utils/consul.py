@@ -13,7 +13,7 @@ import json
 
 from ansible.module_utils.six.moves.urllib import error as urllib_error
 from ansible.module_utils.six.moves.urllib.parse import urlencode
-from ansible.module_utils.urls import open_url
+from ansible.module_utils.urls import Request
 
 
 def get_consul_url(configuration):
@@ -77,6 +77,10 @@ OPERATION_CREATE = "create"
 OPERATION_UPDATE = "update"
 OPERATION_DELETE = "remove"
 
+_OPERATIONAL_ATTRIBUTES = frozenset(
+    {"CreateIndex", "CreateTime", "Hash", "ModifyIndex"}
+)
+
 
 def _normalize_params(params, arg_spec):
     final_params = {}
@@ -118,6 +122,20 @@ class _ConsulModule:
             for k in self.params
             if k not in STATE_PARAMETER and k not in AUTH_ARGUMENTS_SPEC
         }
+        self._requests = self._create_request()
+
+    def _create_request(self):
+        # A single Request instance carries the auth and TLS settings for
+        # every call made during this module run.
+        headers = {}
+        token = self.params.get("token")
+        if token:
+            headers["X-Consul-Token"] = token
+        return Request(
+            headers=headers,
+            validate_certs=self.params["validate_certs"],
+            ca_path=self.params.get("ca_path"),
+        )
 
     def execute(self):
         obj = self.read_object()
@@ -203,9 +221,8 @@ class _ConsulModule:
         return False
 
     def prepare_object(self, existing, obj):
-        operational_attributes = {"CreateIndex", "CreateTime", "Hash", "ModifyIndex"}
         existing = {
-            k: v for k, v in existing.items() if k not in operational_attributes
+            k: v for k, v in existing.items() if k not in _OPERATIONAL_ATTRIBUTES
         }
         for k, v in obj.items():
             existing[k] = v
@@ -215,7 +232,7 @@ class _ConsulModule:
         if operation == OPERATION_CREATE:
             return self.api_endpoint
         elif identifier:
-            return "/".join([self.api_endpoint, identifier])
+            return [self.api_endpoint, identifier]
         raise RuntimeError("invalid arguments passed")
 
     def read_object(self):
@@ -263,7 +280,6 @@ class _ConsulModule:
             # Remove values that are None
             params = {k: v for k, v in params.items() if v is not None}
 
-        ca_path = module_params.get("ca_path")
         base_url = "%s://%s:%s/v1" % (
             module_params["scheme"],
             module_params["host"],
@@ -272,24 +288,13 @@ class _ConsulModule:
         url = "/".join([base_url] + list(url_parts))
 
         headers = {}
-        token = self.params.get("token")
-        if token:
-            headers["X-Consul-Token"] = token
-
         try:
             if data is not None:
                 data = json.dumps(data)
                 headers["Content-Type"] = "application/json"
             if params:
                 url = "%s?%s" % (url, urlencode(params))
-            response = open_url(
-                url,
-                method=method,
-                data=data,
-                headers=headers,
-                validate_certs=module_params["validate_certs"],
-                ca_path=ca_path,
-            )
+            response = self._requests.open(method, url, data=data, headers=headers)
             response_data = response.read()
             status = (
                 response.status if hasattr(response, "status") else response.getcode()